@@ -0,0 +1 @@
+# thermodynamics-sdk/examples/__init__.py
@@ -1,12 +1,10 @@
 # thermodynamics_sdk/examples/basic_usage.py
 
-import sys
+# Run from the project root with: python -m examples.basic_usage
+
 import os
 
-# Ensure the package directory is in the search path
-parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if parent_dir not in sys.path:
-    sys.path.append(parent_dir)
+import numpy as np
 
 from thermodynamics_sdk.core import ThermodynamicSystem, FirstLawCalculator, save_system_to_json, load_system_from_json
 
@@ -65,8 +63,18 @@ def run_basic_example():
         f"  Given ΔU={delta_u_b} J and Q={heat_added_b} J, W = Q - ΔU = {heat_added_b} - ({delta_u_b}) = {work_done_b} J"
     )
 
-    # 5. JSON Persistence: Save and Load System State
-    print("\n5. Demonstrating JSON Persistence:")
+    # 5. Batch calculations over many systems at once
+    print("\n5. Demonstrating Batch Calculations (NumPy arrays):")
+    heat_added_sweep = np.linspace(0.0, 400.0, 5)  # J
+    work_done_sweep = np.full(5, 70.0)  # J
+    delta_u_sweep = FirstLawCalculator.calculate_delta_u_batch(
+        heat_added_sweep, work_done_sweep)
+    print(f"  Q sweep:  {heat_added_sweep} J")
+    print(f"  W sweep:  {work_done_sweep} J")
+    print(f"  ΔU sweep: {delta_u_sweep} J")
+
+    # 6. JSON Persistence: Save and Load System State
+    print("\n6. Demonstrating JSON Persistence:")
     json_filename = "system_state.json"
     system_to_save = ThermodynamicSystem(internal_energy=150.0,
                                          heat_added=100.0,
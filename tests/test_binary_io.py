@@ -0,0 +1,168 @@
+# thermodynamics-sdk/tests/test_binary_io.py
+
+import os
+
+import numpy as np
+import pytest
+from thermodynamics_sdk.core import (ThermodynamicSystem,
+                                     ThermodynamicSystemArray,
+                                     save_system_to_binary,
+                                     load_system_from_binary,
+                                     save_systems_to_binary,
+                                     load_systems_from_binary, save_system,
+                                     load_system)
+
+
+@pytest.fixture
+def temp_binary_file(tmp_path):
+    """Fixture providing a path for a temporary binary file."""
+    return str(tmp_path / "system.bin")
+
+
+def test_binary_save_load_round_trip(temp_binary_file):
+    """Test saving a system to binary and loading it back, ensuring data integrity."""
+    original_system = ThermodynamicSystem(internal_energy=75.5,
+                                          heat_added=-10.0,
+                                          work_done=0.1)
+
+    save_system_to_binary(original_system, temp_binary_file)
+    loaded_system = load_system_from_binary(temp_binary_file)
+
+    assert original_system == loaded_system
+
+
+def test_binary_file_layout(temp_binary_file):
+    """Test the binary file is a magic header followed by three float64 values."""
+    save_system_to_binary(ThermodynamicSystem(1.0, 2.0, 3.0), temp_binary_file)
+    with open(temp_binary_file, 'rb') as f:
+        raw = f.read()
+
+    assert len(raw) == 28
+    assert raw.startswith(b"THSD")
+
+
+def test_save_system_to_binary_invalid_system_type(temp_binary_file):
+    """Test save_system_to_binary raises TypeError for invalid system input."""
+    with pytest.raises(
+            TypeError,
+            match="Input 'system' must be an instance of ThermodynamicSystem."
+    ):
+        save_system_to_binary("not a system", temp_binary_file)
+
+
+def test_load_system_from_binary_file_not_found():
+    """Test load_system_from_binary raises FileNotFoundError for non-existent file."""
+    with pytest.raises(FileNotFoundError,
+                       match="File not found: non_existent_file.bin"):
+        load_system_from_binary("non_existent_file.bin")
+
+
+def test_load_system_from_binary_invalid_content(temp_binary_file):
+    """Test load_system_from_binary raises ValueError for foreign or truncated files."""
+    with open(temp_binary_file, 'wb') as f:
+        f.write(b"{\"internal_energy\": 100.0}")
+
+    with pytest.raises(ValueError, match="is not a valid binary system record"):
+        load_system_from_binary(temp_binary_file)
+
+
+def test_save_load_system_dispatch_by_suffix(tmp_path):
+    """Test save_system/load_system pick the format from the file suffix."""
+    system = ThermodynamicSystem(internal_energy=100.0,
+                                 heat_added=50.0,
+                                 work_done=20.0)
+    binary_file = str(tmp_path / "system.bin")
+    json_file = str(tmp_path / "system.json")
+
+    save_system(system, binary_file)
+    save_system(system, json_file)
+
+    with open(binary_file, 'rb') as f:
+        assert f.read(4) == b"THSD"
+    with open(json_file, 'rb') as f:
+        assert f.read(1) == b"{"
+    assert load_system(binary_file) == system
+    assert load_system(json_file) == system
+
+
+def test_binary_save_load_systems_round_trip(temp_binary_file):
+    """Test saving a ThermodynamicSystemArray to binary and loading it back."""
+    original = ThermodynamicSystemArray(1000)
+    original.internal_energy[:] = np.linspace(-1.0, 1.0, 1000)
+    original.heat_added[:] = np.arange(1000.0)
+    original.work_done[:] = -np.arange(1000.0)
+
+    save_systems_to_binary(original, temp_binary_file)
+    loaded = load_systems_from_binary(temp_binary_file)
+
+    assert len(loaded) == 1000
+    np.testing.assert_array_equal(loaded.internal_energy, original.internal_energy)
+    np.testing.assert_array_equal(loaded.heat_added, original.heat_added)
+    np.testing.assert_array_equal(loaded.work_done, original.work_done)
+    with open(temp_binary_file, 'rb') as f:
+        assert f.read(4) == b"TSDK"
+        assert len(f.read()) == 28 + 3 * 8 * 1000
+
+
+def test_load_systems_from_binary_is_copy_on_write(temp_binary_file):
+    """Test modifying loaded columns leaves the file untouched."""
+    save_systems_to_binary(ThermodynamicSystemArray(3), temp_binary_file)
+
+    loaded = load_systems_from_binary(temp_binary_file)
+    loaded.heat_added[:] = 5.0
+
+    reloaded = load_systems_from_binary(temp_binary_file)
+    np.testing.assert_array_equal(reloaded.heat_added, np.zeros(3))
+
+
+def test_save_systems_to_binary_over_loaded_file(temp_binary_file):
+    """Test load, modify, save back to the same path keeps both copies intact."""
+    original = ThermodynamicSystemArray(100_000)
+    original.heat_added[:] = np.arange(100_000.0)
+    save_systems_to_binary(original, temp_binary_file)
+
+    loaded = load_systems_from_binary(temp_binary_file)
+    loaded.work_done[:] = 1.0
+    save_systems_to_binary(loaded, temp_binary_file)
+
+    # The loaded array still reads its (old, mapped) data...
+    np.testing.assert_array_equal(loaded.heat_added, original.heat_added)
+    # ...and the file holds the modified systems.
+    reloaded = load_systems_from_binary(temp_binary_file)
+    np.testing.assert_array_equal(reloaded.heat_added, original.heat_added)
+    np.testing.assert_array_equal(reloaded.work_done, np.ones(100_000))
+    assert os.listdir(os.path.dirname(temp_binary_file)) == ["system.bin"]
+
+
+def test_save_systems_to_binary_failure_leaves_no_temp_file(temp_binary_file):
+    """Test a failed save removes its temporary file and keeps the target."""
+    save_systems_to_binary(ThermodynamicSystemArray(2), temp_binary_file)
+    broken = ThermodynamicSystemArray(2)
+    broken.heat_added = np.array(["a", "b"])
+
+    with pytest.raises(ValueError):
+        save_systems_to_binary(broken, temp_binary_file)
+
+    assert os.listdir(os.path.dirname(temp_binary_file)) == ["system.bin"]
+    assert len(load_systems_from_binary(temp_binary_file)) == 2
+
+
+def test_binary_save_load_empty_systems(temp_binary_file):
+    """Test saving/loading an empty ThermodynamicSystemArray."""
+    save_systems_to_binary(ThermodynamicSystemArray(0), temp_binary_file)
+    assert len(load_systems_from_binary(temp_binary_file)) == 0
+
+
+def test_load_systems_from_binary_invalid_content(temp_binary_file):
+    """Test load_systems_from_binary rejects single-system and truncated files."""
+    save_system_to_binary(ThermodynamicSystem(), temp_binary_file)
+    with pytest.raises(ValueError,
+                       match="is not a valid binary system array file"):
+        load_systems_from_binary(temp_binary_file)
+
+    save_systems_to_binary(ThermodynamicSystemArray(2), temp_binary_file)
+    with open(temp_binary_file, 'r+b') as f:
+        f.truncate(40)
+    with pytest.raises(ValueError,
+                       match="is not a valid binary system array file"):
+        load_systems_from_binary(temp_binary_file)
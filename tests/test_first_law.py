@@ -1,7 +1,14 @@
 # thermodynamics-sdk/tests/test_first_law.py
 
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
 import pytest
 from thermodynamics_sdk.core import ThermodynamicSystem, FirstLawCalculator
+from thermodynamics_sdk import _jit
 
 
 def test_calculate_delta_u_correctness():
@@ -59,6 +66,14 @@ def test_calculate_heat_added_correctness():
             f"For ΔU={delta_u}, W={work_done}: Expected Q={expected_heat_added}, Got {actual_heat_added}"
 
 
+def test_inverse_calculations_return_floats_for_integers():
+    """Test integer inputs are coerced, so inverse calculations always return floats."""
+    heat_added = FirstLawCalculator.calculate_heat_added(50, 20)
+    work_done = FirstLawCalculator.calculate_work_done(50, 70)
+    assert heat_added == 70.0 and type(heat_added) is float
+    assert work_done == 20.0 and type(work_done) is float
+
+
 def test_calculate_heat_added_type_validation():
     """Test type validation for calculate_heat_added inputs."""
     with pytest.raises(TypeError, match="delta_u must be a float"):
@@ -140,3 +155,173 @@ def test_inverse_calculations_round_trip():
     work_done_recalc_from_q_neg = FirstLawCalculator.calculate_work_done(
         delta_u_orig_neg, heat_added_calc_q_neg)
     assert work_done_recalc_from_q_neg == pytest.approx(work_done_orig_neg)
+
+
+def test_batch_calculations_match_scalar():
+    """Test that the batch methods agree element-wise with the scalar methods."""
+    q = np.array([100.0, 50.0, 0.0, -50.0, 30.0])
+    w = np.array([50.0, 100.0, 75.0, -20.0, -10.0])
+
+    delta_u = FirstLawCalculator.calculate_delta_u_batch(q, w)
+    heat_added = FirstLawCalculator.calculate_heat_added_batch(delta_u, w)
+    work_done = FirstLawCalculator.calculate_work_done_batch(delta_u, q)
+
+    for i in range(len(q)):
+        system = ThermodynamicSystem(heat_added=q[i], work_done=w[i])
+        assert delta_u[i] == pytest.approx(
+            FirstLawCalculator.calculate_delta_u(system))
+    np.testing.assert_allclose(heat_added, q)
+    np.testing.assert_allclose(work_done, w)
+
+
+def test_batch_calculation_writes_into_out():
+    """Test that the batch methods write into a caller-provided buffer."""
+    q = np.array([10.0, 20.0, 30.0])
+    w = np.array([1.0, 2.0, 3.0])
+    out = np.empty(3)
+
+    result = FirstLawCalculator.calculate_delta_u_batch(q, w, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, [9.0, 18.0, 27.0])
+
+
+def test_batch_calculation_accepts_array_likes_and_broadcasts():
+    """Test that batch methods accept lists/ints and broadcast scalars."""
+    delta_u = FirstLawCalculator.calculate_delta_u_batch([100, 50, 0], 25.0)
+    assert delta_u.dtype == np.float64
+    np.testing.assert_array_equal(delta_u, [75.0, 25.0, -25.0])
+
+    heat_added = FirstLawCalculator.calculate_heat_added_batch(
+        np.arange(3), [[1.0], [2.0]])
+    assert heat_added.shape == (2, 3)
+    np.testing.assert_array_equal(heat_added, [[1.0, 2.0, 3.0], [2.0, 3.0, 4.0]])
+
+
+def test_batch_calculation_type_validation():
+    """Test type validation for batch calculation inputs."""
+    w = np.zeros(3)
+    with pytest.raises(TypeError, match="heat_added must be an array-like of floats"):
+        FirstLawCalculator.calculate_delta_u_batch(["a", "b", "c"], w)
+    with pytest.raises(TypeError, match="work_done must be an array-like of floats"):
+        FirstLawCalculator.calculate_delta_u_batch([1, 2], None)
+    with pytest.raises(TypeError, match="heat_added must be an array-like of floats"):
+        FirstLawCalculator.calculate_delta_u_batch(["1.5", "2"], 0.5)
+    with pytest.raises(TypeError, match="work_done must be an array-like of floats"):
+        FirstLawCalculator.calculate_heat_added_batch(w, "0.5")
+    with pytest.raises(TypeError, match="heat_added must be an array-like of floats"):
+        FirstLawCalculator.calculate_work_done_batch(w, w + 1j)
+    with pytest.raises(TypeError, match="delta_u must be an array-like of floats"):
+        FirstLawCalculator.calculate_heat_added_batch({"dU": 1.0}, w)
+    with pytest.raises(ValueError):
+        FirstLawCalculator.calculate_work_done_batch(w, np.zeros(4))
+
+
+def test_jit_kernels_match_calculator():
+    """Test the (optionally Numba-compiled) kernels agree with FirstLawCalculator."""
+    for q, w in [(100.0, 50.0), (-50.0, -20.0), (30.0, -10.0)]:
+        system = ThermodynamicSystem(heat_added=q, work_done=w)
+        delta_u = _jit._delta_u(q, w)
+        assert delta_u == FirstLawCalculator.calculate_delta_u(system)
+        assert _jit._heat_added(delta_u, w) == \
+            FirstLawCalculator.calculate_heat_added(delta_u, w)
+        assert _jit._work_done(delta_u, q) == \
+            FirstLawCalculator.calculate_work_done(delta_u, q)
+
+
+def test_large_batch_calculations():
+    """Test batches above the parallel-kernel threshold give NumPy's results."""
+    rng = np.random.default_rng(0)
+    q = rng.normal(size=200_000)
+    w = rng.normal(size=200_000)
+
+    delta_u = FirstLawCalculator.calculate_delta_u_batch(q, w)
+    np.testing.assert_array_equal(delta_u, q - w)
+
+    out = np.empty_like(q)
+    result = FirstLawCalculator.calculate_heat_added_batch(delta_u, w, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, delta_u + w)
+
+    np.testing.assert_array_equal(
+        FirstLawCalculator.calculate_work_done_batch(delta_u, q), q - delta_u)
+
+    # Broadcasting a scalar against a large array.
+    np.testing.assert_array_equal(
+        FirstLawCalculator.calculate_heat_added_batch(delta_u, 10.0),
+        delta_u + 10.0)
+
+
+def test_jit_ufuncs_broadcast():
+    """Test the element-wise kernels broadcast like NumPy ufuncs."""
+    q = np.array([[100.0, -50.0, 30.0], [0.0, 1.0, 2.0]])
+    w = np.array([50.0, -20.0, -10.0])
+
+    np.testing.assert_array_equal(_jit._delta_u_ufunc(q, w), q - w)
+    np.testing.assert_array_equal(_jit._heat_added_ufunc(q, 5.0), q + 5.0)
+    np.testing.assert_array_equal(_jit._work_done_ufunc(w, q), q - w)
+
+
+def test_jit_kernels_in_threaded_user_loop():
+    """Test a user's nogil loop over the compiled kernels runs on several threads."""
+    numba = pytest.importorskip("numba")
+    from concurrent.futures import ThreadPoolExecutor
+
+    @numba.njit(nogil=True)
+    def delta_u_loop(q, w, out):
+        for i in range(q.shape[0]):
+            out[i] = _jit._delta_u(q[i], w[i])
+
+    assert _jit._delta_u.targetoptions["nogil"]
+    q = np.arange(1000.0)
+    w = np.full_like(q, 5.0)
+    out = np.empty_like(q)
+    chunks = [slice(i, i + 250) for i in range(0, q.size, 250)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda c: delta_u_loop(q[c], w[c], out[c]), chunks))
+    np.testing.assert_array_equal(out, q - w)
+
+
+def test_batch_chained_inversion_reuses_one_buffer():
+    """Test Q = ΔU + W then W = Q - ΔU computed in place in a single buffer."""
+    delta_u = np.linspace(-100.0, 100.0, 5)
+    w = np.array([5.0, -3.0, 0.0, 12.5, 7.0])
+    buf = w.copy()
+
+    heat = FirstLawCalculator.calculate_heat_added_batch(delta_u, buf, out=buf)
+    assert heat is buf
+    np.testing.assert_array_equal(buf, delta_u + w)
+
+    work = FirstLawCalculator.calculate_work_done_batch(delta_u, buf, out=buf)
+    assert work is buf
+    np.testing.assert_array_equal(buf, w)
+
+    with pytest.raises(ValueError):
+        FirstLawCalculator.calculate_delta_u_batch(delta_u, w, out=np.empty(4))
+
+
+def test_large_batches_from_several_threads():
+    """Test concurrent large batches under Numba's workqueue layer don't abort."""
+    pytest.importorskip("numba")
+    # The workqueue layer aborts the whole process on concurrent use, and
+    # the layer is fixed once chosen, so run the check in a fresh interpreter.
+    script = textwrap.dedent("""
+        from concurrent.futures import ThreadPoolExecutor
+        import numpy as np
+        from thermodynamics_sdk import FirstLawCalculator
+
+        q = np.arange(200_000.0)
+        w = np.ones_like(q)
+
+        def run(_):
+            for _ in range(10):
+                result = FirstLawCalculator.calculate_delta_u_batch(q, w)
+                assert np.array_equal(result, q - w)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(run, range(8)))
+    """)
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue",
+               PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run([sys.executable, "-c", script], env=env,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -1,19 +1,18 @@
 # thermodynamics-sdk/tests/test_json_io.py
 
 import pytest
-import os
-import tempfile
 import json
-from thermodynamics_sdk.core import ThermodynamicSystem, save_system_to_json, load_system_from_json
+from thermodynamics_sdk.core import (ThermodynamicSystem,
+                                     ThermodynamicSystemArray,
+                                     save_system_to_json, load_system_from_json,
+                                     save_systems_to_json,
+                                     load_systems_from_json)
 
 
 @pytest.fixture
-def temp_json_file():
-    """Fixture to create a temporary JSON file and ensure its cleanup."""
-    fd, path = tempfile.mkstemp(suffix=".json")
-    os.close(fd)  # Close the file descriptor, as we'll open it with open()
-    yield path
-    os.remove(path)
+def temp_json_file(tmp_path):
+    """Fixture providing a path for a temporary JSON file (removed by pytest)."""
+    return str(tmp_path / "system.json")
 
 
 def test_json_save_load_round_trip_basic(temp_json_file):
@@ -67,6 +66,18 @@ def test_json_save_load_round_trip_mixed_values(temp_json_file):
     assert original_system == loaded_system
 
 
+def test_json_save_load_round_trip_non_finite_values(temp_json_file):
+    """Test saving/loading a system with infinite values."""
+    original_system = ThermodynamicSystem(internal_energy=float("inf"),
+                                          heat_added=float("-inf"),
+                                          work_done=0.0)
+
+    save_system_to_json(original_system, temp_json_file)
+    loaded_system = load_system_from_json(temp_json_file)
+
+    assert original_system == loaded_system
+
+
 def test_save_system_to_json_invalid_system_type(temp_json_file):
     """Test save_system_to_json raises TypeError for invalid system input."""
     with pytest.raises(
@@ -111,6 +122,16 @@ def test_load_system_from_json_missing_keys(temp_json_file):
         load_system_from_json(temp_json_file)
 
 
+def test_load_system_from_json_not_an_object(temp_json_file):
+    """Test load_system_from_json raises ValueError for a non-object document."""
+    for data in ([1.0, 2.0, 3.0], "abc"):
+        with open(temp_json_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        with pytest.raises(ValueError,
+                           match="Missing key 'internal_energy' in system data"):
+            load_system_from_json(temp_json_file)
+
+
 def test_load_system_from_json_invalid_data_types(temp_json_file):
     """Test load_system_from_json raises TypeError for incorrect data types in JSON."""
     # Create a JSON file with 'internal_energy' as a string
@@ -127,3 +148,79 @@ def test_load_system_from_json_invalid_filename_type():
     """Test load_system_from_json raises TypeError for invalid filename input."""
     with pytest.raises(TypeError, match="Input 'filename' must be a string."):
         load_system_from_json(None)
+
+
+def test_json_save_load_systems_round_trip(temp_json_file):
+    """Test saving a ThermodynamicSystemArray as JSON columns and loading it back."""
+    original = ThermodynamicSystemArray.from_systems([
+        ThermodynamicSystem(internal_energy=100.0, heat_added=50.0, work_done=20.0),
+        ThermodynamicSystem(internal_energy=-5.5, heat_added=0.0, work_done=float("inf")),
+    ])
+
+    save_systems_to_json(original, temp_json_file)
+    with open(temp_json_file, 'r', encoding='utf-8') as f:
+        assert json.load(f)["internal_energy"] == [100.0, -5.5]
+    loaded = load_systems_from_json(temp_json_file)
+
+    assert loaded.to_systems() == original.to_systems()
+
+
+def test_json_save_load_systems_non_native_columns(temp_json_file):
+    """Test big-endian and integer columns are written as their float values."""
+    original = ThermodynamicSystemArray(3)
+    original.internal_energy = (original.internal_energy + [0.0, 1.0, 2.0]).astype(">f8")
+    original.heat_added = original.heat_added.astype("i8") + 7
+    original.work_done[:] = -1.5
+
+    save_systems_to_json(original, temp_json_file)
+    with open(temp_json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    assert data["internal_energy"] == [0.0, 1.0, 2.0]
+    assert data["heat_added"] == [7.0, 7.0, 7.0]
+
+    loaded = load_systems_from_json(temp_json_file)
+    assert loaded.internal_energy.tolist() == [0.0, 1.0, 2.0]
+    assert loaded.heat_added.tolist() == [7.0, 7.0, 7.0]
+    assert loaded.work_done.tolist() == [-1.5, -1.5, -1.5]
+
+
+def test_load_systems_from_json_accepts_booleans(temp_json_file):
+    """Test JSON booleans load as 0.0/1.0, like in load_system_from_json."""
+    data = {"internal_energy": [True, False], "heat_added": [1.5, 2],
+            "work_done": [0.0, True]}
+    with open(temp_json_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    loaded = load_systems_from_json(temp_json_file)
+    assert loaded.internal_energy.tolist() == [1.0, 0.0]
+    assert loaded.work_done.tolist() == [0.0, 1.0]
+    assert loaded[0] == ThermodynamicSystem.from_dict(
+        {"internal_energy": True, "heat_added": 1.5, "work_done": 0.0})
+
+
+def test_save_systems_to_json_invalid_type(temp_json_file):
+    """Test save_systems_to_json raises TypeError for invalid systems input."""
+    with pytest.raises(
+            TypeError,
+            match="Input 'systems' must be an instance of ThermodynamicSystemArray."
+    ):
+        save_systems_to_json([ThermodynamicSystem()], temp_json_file)
+
+
+def test_load_systems_from_json_invalid_data(temp_json_file):
+    """Test load_systems_from_json rejects missing keys, bad types and ragged columns."""
+    cases = [
+        ({"internal_energy": [1.0], "work_done": [2.0]}, ValueError,
+         "Missing key 'heat_added' in system data"),
+        ({"internal_energy": ["1.0"], "heat_added": [1.0], "work_done": [2.0]},
+         TypeError, "Value for 'internal_energy' must be a list of floats"),
+        ({"internal_energy": [1.0], "heat_added": [1.0, 2.0], "work_done": [2.0]},
+         ValueError, "columns must all have the same length"),
+        ([[1.0], [1.0], [2.0]], ValueError,
+         "Missing key 'internal_energy' in system data"),
+    ]
+    for data, error, message in cases:
+        with open(temp_json_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        with pytest.raises(error, match=message):
+            load_systems_from_json(temp_json_file)
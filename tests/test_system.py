@@ -1,5 +1,6 @@
 # thermodynamics-sdk/tests/test_system.py
 
+import numpy as np
 import pytest
 from thermodynamics_sdk.core import ThermodynamicSystem
 
@@ -35,6 +36,17 @@ def test_system_initialization_with_integers():
     assert isinstance(system.work_done, float)
 
 
+def test_system_initialization_with_numpy_floats():
+    """Test ThermodynamicSystem coerces NumPy float64 values to plain floats."""
+    system = ThermodynamicSystem(internal_energy=np.float64(1.5),
+                                 heat_added=np.float64(2.5),
+                                 work_done=np.float64(-0.5))
+    assert system.internal_energy == 1.5
+    assert type(system.internal_energy) is float
+    assert type(system.heat_added) is float
+    assert type(system.work_done) is float
+
+
 def test_system_type_validation_on_init():
     """Test that __init__ raises TypeError for non-float/int arguments."""
     with pytest.raises(TypeError,
@@ -93,6 +105,17 @@ def test_property_setters_type_validation():
         system.work_done = [10]
 
 
+def test_delta_u_method():
+    """Test the delta_u method computes ΔU = Q - W from the system's fields."""
+    system = ThermodynamicSystem(internal_energy=100.0,
+                                 heat_added=50.0,
+                                 work_done=20.0)
+    assert system.delta_u() == 30.0
+
+    system.work_done = 80.0
+    assert system.delta_u() == -30.0
+
+
 def test_to_dict_method():
     """Test the to_dict method for correct dictionary representation."""
     system = ThermodynamicSystem(internal_energy=100.0,
@@ -137,6 +160,10 @@ def test_from_dict_missing_keys():
                        match="Missing key 'heat_added' in system data"):
         ThermodynamicSystem.from_dict(data_missing_q)
 
+    with pytest.raises(ValueError,
+                       match="Missing key 'internal_energy' in system data"):
+        ThermodynamicSystem.from_dict({})
+
 
 def test_from_dict_invalid_types():
     """Test from_dict handles invalid types in dictionary values."""
@@ -159,6 +186,21 @@ def test_from_dict_invalid_types():
         ThermodynamicSystem.from_dict(data_invalid_q)
 
 
+def test_from_dict_invalid_type_before_missing_key():
+    """Test from_dict reports the first problem in field order."""
+    with pytest.raises(TypeError,
+                       match="Value for 'internal_energy' must be a float"):
+        ThermodynamicSystem.from_dict({"internal_energy": "x"})
+    with pytest.raises(TypeError,
+                       match="Value for 'heat_added' must be a float"):
+        ThermodynamicSystem.from_dict({"internal_energy": 1.0,
+                                       "heat_added": None})
+    with pytest.raises(ValueError,
+                       match="Missing key 'heat_added' in system data"):
+        ThermodynamicSystem.from_dict({"internal_energy": 1.0,
+                                       "work_done": "x"})
+
+
 def test_system_equality():
     """Test __eq__ method for ThermodynamicSystem."""
     system1 = ThermodynamicSystem(internal_energy=100.0,
@@ -174,6 +216,7 @@ def test_system_equality():
                                   heat_added=50,
                                   work_done=20)  # Test with ints
 
+    assert system1 == system1
     assert system1 == system2
     assert system1 != system3
     assert system1 == system4  # Should be equal after float coercion
@@ -181,6 +224,12 @@ def test_system_equality():
     assert not (system1 == "not a system")  # Ensure it doesn't raise an error
 
 
+def test_system_is_unhashable():
+    """Test ThermodynamicSystem is unhashable, since its fields are mutable."""
+    with pytest.raises(TypeError):
+        hash(ThermodynamicSystem())
+
+
 def test_system_repr():
     """Test __repr__ method for ThermodynamicSystem."""
     system = ThermodynamicSystem(internal_energy=100.0,
@@ -188,3 +237,11 @@ def test_system_repr():
                                  work_done=20.0)
     expected_repr = "ThermodynamicSystem(internal_energy=100.0, heat_added=50.0, work_done=20.0)"
     assert repr(system) == expected_repr
+
+
+def test_system_uses_slots():
+    """Test ThermodynamicSystem instances carry no per-instance __dict__."""
+    system = ThermodynamicSystem()
+    assert not hasattr(system, "__dict__")
+    with pytest.raises(AttributeError):
+        system.temperature = 300.0
@@ -0,0 +1,117 @@
+# thermodynamics-sdk/tests/test_system_array.py
+
+import numpy as np
+import pytest
+from thermodynamics_sdk.core import (ThermodynamicSystem,
+                                     ThermodynamicSystemArray,
+                                     FirstLawCalculator)
+
+
+def test_system_array_initialization():
+    """Test ThermodynamicSystemArray allocates zeroed float64 columns."""
+    arr = ThermodynamicSystemArray(4)
+    assert len(arr) == 4
+    for column in (arr.internal_energy, arr.heat_added, arr.work_done):
+        assert column.dtype == np.float64
+        np.testing.assert_array_equal(column, np.zeros(4))
+
+
+def test_system_array_from_systems_and_getitem():
+    """Test bulk-loading systems and reading them back one at a time."""
+    systems = [
+        ThermodynamicSystem(internal_energy=100.0, heat_added=50.0, work_done=20.0),
+        ThermodynamicSystem(internal_energy=-5.0, heat_added=0.0, work_done=7.5),
+        ThermodynamicSystem(internal_energy=1, heat_added=2, work_done=3),
+    ]
+    arr = ThermodynamicSystemArray.from_systems(systems)
+
+    assert len(arr) == len(systems)
+    for i, system in enumerate(systems):
+        assert arr[i] == system
+    assert arr[-1] == systems[-1]
+    with pytest.raises(TypeError):
+        arr[0:2]
+
+
+def test_system_array_from_systems_invalid_element():
+    """Test from_systems raises TypeError for elements that are not systems."""
+    with pytest.raises(TypeError,
+                       match="must be ThermodynamicSystem instances"):
+        ThermodynamicSystemArray.from_systems([ThermodynamicSystem(), 5])
+    with pytest.raises(TypeError,
+                       match="must be ThermodynamicSystem instances"):
+        ThermodynamicSystemArray.from_systems([{"internal_energy": 1.0}])
+
+
+def test_system_array_to_systems():
+    """Test converting an array back into ThermodynamicSystem instances."""
+    systems = [
+        ThermodynamicSystem(internal_energy=100.0, heat_added=50.0, work_done=20.0),
+        ThermodynamicSystem(internal_energy=-5.0, heat_added=0.0, work_done=7.5),
+    ]
+    round_tripped = ThermodynamicSystemArray.from_systems(systems).to_systems()
+
+    assert round_tripped == systems
+    assert all(type(s.internal_energy) is float for s in round_tripped)
+
+
+def test_system_array_delta_u():
+    """Test delta_u matches FirstLawCalculator for every system."""
+    systems = [
+        ThermodynamicSystem(heat_added=q, work_done=w)
+        for q, w in [(100.0, 50.0), (50.0, 100.0), (-50.0, -20.0), (30.0, -10.0)]
+    ]
+    arr = ThermodynamicSystemArray.from_systems(systems)
+
+    expected = [FirstLawCalculator.calculate_delta_u(s) for s in systems]
+    np.testing.assert_allclose(arr.delta_u(), expected)
+    np.testing.assert_allclose(FirstLawCalculator.calculate_delta_u(arr),
+                               expected)
+
+    out = np.empty(len(arr))
+    assert arr.delta_u(out=out) is out
+    np.testing.assert_allclose(out, expected)
+
+
+def test_system_array_npz_round_trip(tmp_path):
+    """Test saving to and loading from a .npz archive."""
+    arr = ThermodynamicSystemArray(3)
+    arr.internal_energy[:] = [1.0, 2.0, 3.0]
+    arr.heat_added[:] = [4.0, 5.0, 6.0]
+    arr.work_done[:] = [7.0, 8.0, 9.0]
+    filename = str(tmp_path / "systems.npz")
+
+    arr.save_to_npz(filename)
+    loaded = ThermodynamicSystemArray.load_from_npz(filename)
+
+    np.testing.assert_array_equal(loaded.internal_energy, arr.internal_energy)
+    np.testing.assert_array_equal(loaded.heat_added, arr.heat_added)
+    np.testing.assert_array_equal(loaded.work_done, arr.work_done)
+
+
+def test_system_array_load_from_npz_validates_columns(tmp_path):
+    """Test load_from_npz rejects ragged, non-numeric or missing columns."""
+    filename = str(tmp_path / "systems.npz")
+    cases = [
+        (dict(internal_energy=np.zeros(3), heat_added=np.zeros(2),
+              work_done=np.zeros(5)),
+         ValueError, "columns must all have the same length"),
+        (dict(internal_energy=np.zeros((2, 2)), heat_added=np.zeros(2),
+              work_done=np.zeros(2)),
+         TypeError, "Value for 'internal_energy' must be a list of floats"),
+        (dict(internal_energy=np.zeros(2), heat_added=np.array(["a", "b"]),
+              work_done=np.zeros(2)),
+         TypeError, "Value for 'heat_added' must be a list of floats"),
+        (dict(internal_energy=np.zeros(2), heat_added=np.zeros(2)),
+         ValueError, "Missing key 'work_done'"),
+    ]
+    for columns, error, message in cases:
+        np.savez(filename, **columns)
+        with pytest.raises(error, match=message):
+            ThermodynamicSystemArray.load_from_npz(filename)
+
+    np.savez(filename, internal_energy=np.arange(3),
+             heat_added=np.zeros(3, dtype=">f8"), work_done=np.ones(3))
+    loaded = ThermodynamicSystemArray.load_from_npz(filename)
+    assert loaded.internal_energy.dtype == np.float64
+    assert loaded.heat_added.dtype == np.float64
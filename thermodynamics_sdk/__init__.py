@@ -4,6 +4,11 @@ A stable, minimal, correct foundation for modeling simple thermodynamic systems
 using the First Law of Thermodynamics.
 """
 
-from .core import ThermodynamicSystem, FirstLawCalculator, save_system_to_json, load_system_from_json
+from .core import (ThermodynamicSystem, ThermodynamicSystemArray,
+                   FirstLawCalculator, save_system_to_json,
+                   load_system_from_json, save_systems_to_json,
+                   load_systems_from_json, save_system_to_binary,
+                   load_system_from_binary, save_systems_to_binary,
+                   load_systems_from_binary, save_system, load_system)
 
 __version__ = "1.0.0"
@@ -0,0 +1,85 @@
+"""
+Optional Numba-compiled First Law kernels.
+
+Numba is a soft dependency. When it is installed the kernels are compiled
+with ``@njit(cache=True)``; the compiled machine code is written next to this
+module (``.nbi``/``.nbc`` files in ``__pycache__``), so only the very first
+call in a fresh environment pays the compilation cost and later processes
+load the cached code in well under a second. Without Numba the kernels are
+the plain Python functions and give identical results.
+
+The scalar kernels are meant to be called from other compiled code (the
+array kernels below, or a user's ``@njit`` loop). Called one at a time from
+the interpreter, Numba's dispatch costs more than the subtraction itself,
+which is why ``FirstLawCalculator``'s scalar methods do not route through
+them. They are compiled with ``nogil=True``, so a user's own
+``@njit(nogil=True)`` node-by-node loop that calls them can run on several
+Python threads at once.
+
+The ``*_ufunc`` variants wrap the scalar kernels as true NumPy ufuncs
+(``numba.vectorize`` with ``target='parallel'``): they broadcast their
+inputs, accept ``out=``, and spread the work across all cores. They are
+compiled for float64 as soon as this module is imported, so the first batch
+call does not pay for compilation; importing this module is therefore
+deferred until a batch is large enough to use them.
+"""
+
+try:
+    from numba import njit, vectorize
+except ImportError:
+    njit = None
+    vectorize = None
+
+HAVE_NUMBA = njit is not None
+
+_UFUNC_SIGNATURE = "f8(f8, f8)"
+
+
+def _compile(func):
+    """Compiles func with Numba when available, otherwise returns it as is."""
+    if njit is None:
+        return func
+    return njit(cache=True, nogil=True)(func)
+
+
+def _compile_ufunc(func):
+    """Eagerly compiles func into a parallel float64 ufunc when Numba is available."""
+    if vectorize is None:
+        return func
+    return vectorize([_UFUNC_SIGNATURE], target="parallel", cache=True)(func)
+
+
+@_compile
+def _delta_u(heat_added, work_done):
+    """ΔU = Q - W"""
+    return heat_added - work_done
+
+
+@_compile
+def _heat_added(delta_u, work_done):
+    """Q = ΔU + W"""
+    return delta_u + work_done
+
+
+@_compile
+def _work_done(delta_u, heat_added):
+    """W = Q - ΔU"""
+    return heat_added - delta_u
+
+
+@_compile_ufunc
+def _delta_u_ufunc(heat_added, work_done):
+    """ΔU = Q - W, element-wise"""
+    return _delta_u(heat_added, work_done)
+
+
+@_compile_ufunc
+def _heat_added_ufunc(delta_u, work_done):
+    """Q = ΔU + W, element-wise"""
+    return _heat_added(delta_u, work_done)
+
+
+@_compile_ufunc
+def _work_done_ufunc(delta_u, heat_added):
+    """W = Q - ΔU, element-wise"""
+    return _work_done(delta_u, heat_added)
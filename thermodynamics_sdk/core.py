@@ -1,5 +1,89 @@
 import json
-from typing import Dict, Any
+import math
+import operator
+import os
+import struct
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Batches with at least this many elements use the parallel Numba ufuncs when
+# Numba is installed; below it NumPy's ufuncs win, as thread start-up and
+# dispatch dominate.
+_JIT_MIN_SIZE = 100_000
+
+# Serialized field names, in constructor order.
+_REQUIRED_KEYS = ("internal_energy", "heat_added", "work_done")
+
+# Binary record: 4-byte magic followed by internal_energy, heat_added and
+# work_done as little-endian float64.
+_BINARY_MAGIC = b"THSD"
+_BINARY_RECORD = struct.Struct("<4s3d")
+_BINARY_SUFFIX = ".bin"
+
+# Bulk binary file: 32-byte header (4-byte magic, format version, padding,
+# little-endian uint64 system count), then the internal_energy, heat_added
+# and work_done columns back-to-back as little-endian float64.
+_ARRAY_MAGIC = b"TSDK"
+_ARRAY_VERSION = 1
+_ARRAY_HEADER = struct.Struct("<4sB3xQ16x")
+
+# Serializes calls into the parallel Numba ufuncs. Numba's fallback
+# "workqueue" threading layer aborts the process on concurrent use, so a
+# thread that finds the kernels busy uses NumPy instead of waiting.
+_PARALLEL_LOCK = threading.Lock()
+
+
+def _parallel_batch(ufunc_name: str, x: np.ndarray, y: np.ndarray,
+                    out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """
+    Helper to run a batch calculation through a parallel Numba ufunc.
+
+    Returns None, without computing anything, when Numba is not installed,
+    the batch is below _JIT_MIN_SIZE elements, out is not a float64 array, or
+    another thread is already running a parallel ufunc.
+    """
+    if max(x.size, y.size) < _JIT_MIN_SIZE:
+        return None
+    if out is not None and out.dtype != np.float64:
+        return None
+    # Deferred import: loading Numba and its compiled ufuncs takes a while.
+    from . import _jit
+    if not _jit.HAVE_NUMBA:
+        return None
+    if not _PARALLEL_LOCK.acquire(blocking=False):
+        return None
+    try:
+        return getattr(_jit, ufunc_name)(x, y, out=out)
+    finally:
+        _PARALLEL_LOCK.release()
+
+
+def _as_float(name: str, value: Any) -> float:
+    """Helper to validate a float or integer value and return it as a float."""
+    # Exact floats and ints are by far the common cases; skip the isinstance
+    # check (and its MRO walk) for both. bool and other subclasses fall through.
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
+    if not isinstance(value, (int, float)):
+        raise TypeError(
+            f"{name} must be a float or an integer, but got {type(value).__name__}."
+        )
+    return float(value)
 
 
 class ThermodynamicSystem:
@@ -16,8 +100,20 @@ class ThermodynamicSystem:
                             Positive for heat added, negative for heat removed.
         work_done (float): Work done BY the system (Joules).
                            Positive for work done by the system, negative for work done on the system.
+
+    Note:
+        Instances use __slots__ and have no per-instance __dict__. Subclasses
+        should declare their own __slots__ to keep that benefit, and cannot
+        also inherit from another class with non-empty __slots__ (Python
+        raises an instance lay-out conflict).
     """
 
+    # Fixed attribute layout: no per-instance __dict__, smaller objects and
+    # faster attribute access when many systems are created. The public
+    # properties validate on assignment; code inside this module reads the
+    # slots directly to skip the getter call.
+    __slots__ = ("_internal_energy", "_heat_added", "_work_done")
+
     def __init__(self,
                  internal_energy: float = 0.0,
                  heat_added: float = 0.0,
@@ -33,18 +129,17 @@ class ThermodynamicSystem:
         Raises:
             TypeError: If any argument is not a float.
         """
-        self._internal_energy = self._validate_float("internal_energy",
-                                                     internal_energy)
-        self._heat_added = self._validate_float("heat_added", heat_added)
-        self._work_done = self._validate_float("work_done", work_done)
-
-    def _validate_float(self, name: str, value: Any) -> float:
-        """Helper to validate if a value is a float."""
-        if not isinstance(value, (int, float)):
-            raise TypeError(
-                f"{name} must be a float or an integer, but got {type(value).__name__}."
-            )
-        return float(value)
+        # Fast path: all three already exact floats, nothing to coerce.
+        if (type(internal_energy) is float and type(heat_added) is float
+                and type(work_done) is float):
+            self._internal_energy = internal_energy
+            self._heat_added = heat_added
+            self._work_done = work_done
+        else:
+            self._internal_energy = _as_float("internal_energy",
+                                              internal_energy)
+            self._heat_added = _as_float("heat_added", heat_added)
+            self._work_done = _as_float("work_done", work_done)
 
     @property
     def internal_energy(self) -> float:
@@ -54,7 +149,7 @@ class ThermodynamicSystem:
     @internal_energy.setter
     def internal_energy(self, value: float) -> None:
         """Set the internal energy of the system in Joules."""
-        self._internal_energy = self._validate_float("internal_energy", value)
+        self._internal_energy = _as_float("internal_energy", value)
 
     @property
     def heat_added(self) -> float:
@@ -70,7 +165,7 @@ class ThermodynamicSystem:
         Set the heat added to the system in Joules.
         Positive for heat added, negative for heat removed.
         """
-        self._heat_added = self._validate_float("heat_added", value)
+        self._heat_added = _as_float("heat_added", value)
 
     @property
     def work_done(self) -> float:
@@ -86,44 +181,244 @@ class ThermodynamicSystem:
         Set the work done by the system in Joules.
         Positive for work done by the system, negative for work done on the system.
         """
-        self._work_done = self._validate_float("work_done", value)
+        self._work_done = _as_float("work_done", value)
+
+    def delta_u(self) -> float:
+        """
+        Calculates the change in internal energy (ΔU) of this system.
+
+        Formula: ΔU = Q - W
+
+        Returns:
+            float: The change in internal energy (ΔU) in Joules.
+        """
+        return self._heat_added - self._work_done
 
     def to_dict(self) -> Dict[str, float]:
         """Converts the system state to a dictionary for serialization."""
         return {
-            "internal_energy": self.internal_energy,
-            "heat_added": self.heat_added,
-            "work_done": self.work_done,
+            "internal_energy": self._internal_energy,
+            "heat_added": self._heat_added,
+            "work_done": self._work_done,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, float]) -> "ThermodynamicSystem":
         """Creates a ThermodynamicSystem instance from a dictionary."""
-        # Ensure all expected keys are present and are floats
-        for key in ["internal_energy", "heat_added", "work_done"]:
-            if key not in data:
-                raise ValueError(
-                    f"Missing key '{key}' in system data for deserialization.")
-            if not isinstance(data[key], (int, float)):
-                raise TypeError(
-                    f"Value for '{key}' must be a float, but got {type(data[key]).__name__}."
-                )
-
-        return cls(internal_energy=data["internal_energy"],
-                   heat_added=data["heat_added"],
-                   work_done=data["work_done"])
+        # Optimistic path: index directly and let the constructor validate.
+        # The offending key is only looked for once something has failed.
+        try:
+            internal_energy = data["internal_energy"]
+            heat_added = data["heat_added"]
+            work_done = data["work_done"]
+        except (KeyError, TypeError):
+            # Check the keys in field order, each for presence and then type,
+            # so the first problem is reported exactly as before. Non-mappings
+            # such as a JSON list or string end up here too (TypeError) and
+            # are reported as missing keys.
+            for key in _REQUIRED_KEYS:
+                if key not in data:
+                    raise ValueError(
+                        f"Missing key '{key}' in system data for deserialization."
+                    ) from None
+                if not isinstance(data[key], (int, float)):
+                    raise TypeError(
+                        f"Value for '{key}' must be a float, but got {type(data[key]).__name__}."
+                    ) from None
+            raise
+
+        try:
+            # Positional arguments skip building a kwargs dict for the call.
+            return cls(internal_energy, heat_added, work_done)
+        except TypeError:
+            for key, value in zip(_REQUIRED_KEYS,
+                                  (internal_energy, heat_added, work_done)):
+                if not isinstance(value, (int, float)):
+                    raise TypeError(
+                        f"Value for '{key}' must be a float, but got {type(value).__name__}."
+                    ) from None
+            raise
 
     def __eq__(self, other: Any) -> bool:
         """Compares two ThermodynamicSystem objects for equality."""
+        if self is other:
+            return True
         if not isinstance(other, ThermodynamicSystem):
-            return False
-        return (self.internal_energy == other.internal_energy
-                and self.heat_added == other.heat_added
-                and self.work_done == other.work_done)
+            return NotImplemented
+        # Short-circuits on the first differing field.
+        return (self._internal_energy == other._internal_energy
+                and self._heat_added == other._heat_added
+                and self._work_done == other._work_done)
+
+    # Systems are mutable, so they must not be hashable.
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"ThermodynamicSystem(internal_energy={self._internal_energy}, "
+                f"heat_added={self._heat_added}, work_done={self._work_done})")
+
+
+class ThermodynamicSystemArray:
+    """
+    Stores many thermodynamic systems as three contiguous float64 columns.
+
+    Each field lives in its own NumPy array (structure-of-arrays), so bulk
+    calculations over N systems run as single vectorized operations instead
+    of loops over N ThermodynamicSystem objects. The sign convention is the
+    same: ΔU = Q - W, where W is work done BY the system.
+
+    Attributes:
+        internal_energy (np.ndarray): Internal energy of each system (Joules).
+        heat_added (np.ndarray): Heat added TO each system (Joules).
+        work_done (np.ndarray): Work done BY each system (Joules).
+    """
+
+    __slots__ = ("internal_energy", "heat_added", "work_done")
+
+    def __init__(self, n: int):
+        """
+        Initializes an array of n systems with all quantities set to 0.0 J.
+
+        Args:
+            n (int): Number of systems.
+        """
+        self.internal_energy = np.zeros(n)
+        self.heat_added = np.zeros(n)
+        self.work_done = np.zeros(n)
+
+    @classmethod
+    def _from_columns(cls, internal_energy: np.ndarray,
+                      heat_added: np.ndarray,
+                      work_done: np.ndarray) -> "ThermodynamicSystemArray":
+        """Creates an instance that adopts the given float64 columns."""
+        arr = cls.__new__(cls)
+        arr.internal_energy = internal_energy
+        arr.heat_added = heat_added
+        arr.work_done = work_done
+        return arr
+
+    @classmethod
+    def from_systems(
+            cls, systems: Iterable[ThermodynamicSystem]
+    ) -> "ThermodynamicSystemArray":
+        """
+        Bulk-loads ThermodynamicSystem instances into a new array.
+
+        Args:
+            systems (Iterable[ThermodynamicSystem]): The systems to copy.
+
+        Returns:
+            ThermodynamicSystemArray: The systems' data in column form.
+
+        Raises:
+            TypeError: If an element is not a ThermodynamicSystem instance.
+        """
+        systems = list(systems)
+        n = len(systems)
+        try:
+            return cls._from_columns(
+                np.fromiter((s._internal_energy for s in systems), np.float64, n),
+                np.fromiter((s._heat_added for s in systems), np.float64, n),
+                np.fromiter((s._work_done for s in systems), np.float64, n))
+        except AttributeError:
+            raise TypeError(
+                "All elements of 'systems' must be ThermodynamicSystem instances."
+            ) from None
+
+    def to_systems(self) -> List[ThermodynamicSystem]:
+        """
+        Converts the array back into individual ThermodynamicSystem instances.
+
+        Returns:
+            List[ThermodynamicSystem]: One system per element, in order.
+        """
+        return [
+            ThermodynamicSystem(internal_energy, heat_added, work_done)
+            for internal_energy, heat_added, work_done in zip(
+                self.internal_energy.tolist(), self.heat_added.tolist(),
+                self.work_done.tolist())
+        ]
+
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> "ThermodynamicSystemArray":
+        """Creates an instance from a mapping of equal-length number columns."""
+        columns = []
+        for key in _REQUIRED_KEYS:
+            try:
+                column = np.asarray(data[key])
+            except (KeyError, TypeError):
+                # TypeError: data is not a mapping (e.g. a JSON list).
+                raise ValueError(
+                    f"Missing key '{key}' in system data for deserialization."
+                ) from None
+            if column.ndim != 1 or column.dtype.kind not in "biuf":
+                raise TypeError(f"Value for '{key}' must be a list of floats.")
+            columns.append(column.astype(np.float64, copy=False))
+        if not len(columns[0]) == len(columns[1]) == len(columns[2]):
+            raise ValueError(
+                "System data columns must all have the same length.")
+        return cls._from_columns(*columns)
+
+    def __len__(self) -> int:
+        return len(self.internal_energy)
+
+    def __getitem__(self, index: int) -> ThermodynamicSystem:
+        """Returns a ThermodynamicSystem copy of the system at index."""
+        index = operator.index(index)
+        return ThermodynamicSystem(float(self.internal_energy[index]),
+                                   float(self.heat_added[index]),
+                                   float(self.work_done[index]))
+
+    def delta_u(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Returns the change in internal energy (ΔU = Q - W) of every system.
+
+        Args:
+            out (np.ndarray, optional): float64 array of length len(self) to
+                                        write the result into. A new array is
+                                        allocated if omitted.
+
+        Returns:
+            np.ndarray: ΔU of every system in Joules.
+        """
+        result = _parallel_batch("_delta_u_ufunc", self.heat_added,
+                                 self.work_done, out)
+        if result is None:
+            result = np.subtract(self.heat_added, self.work_done, out=out)
+        return result
+
+    def save_to_npz(self, filename: str) -> None:
+        """
+        Saves the three columns to a NumPy .npz archive.
+
+        Args:
+            filename (str): The path to the archive.
+        """
+        np.savez(filename,
+                 internal_energy=self.internal_energy,
+                 heat_added=self.heat_added,
+                 work_done=self.work_done)
+
+    @classmethod
+    def load_from_npz(cls, filename: str) -> "ThermodynamicSystemArray":
+        """
+        Loads an array previously written by save_to_npz.
+
+        Args:
+            filename (str): The path to the archive.
+
+        Returns:
+            ThermodynamicSystemArray: The loaded systems.
+
+        Raises:
+            ValueError: If a column is missing or the columns differ in length.
+            TypeError: If a column is not a 1-D array of numbers.
+        """
+        with np.load(filename) as data:
+            return cls._from_dict(data)
 
     def __repr__(self) -> str:
-        return (f"ThermodynamicSystem(internal_energy={self.internal_energy}, "
-                f"heat_added={self.heat_added}, work_done={self.work_done})")
+        return f"ThermodynamicSystemArray(n={len(self)})"
 
 
 class FirstLawCalculator:
@@ -135,19 +430,26 @@ class FirstLawCalculator:
     """
 
     @staticmethod
-    def _validate_calculation_inputs(delta_u: float = None,
-                                     heat_added: float = None,
-                                     work_done: float = None):
-        """Helper to validate if calculation inputs are floats."""
-        for name, value in [("delta_u", delta_u), ("heat_added", heat_added),
-                            ("work_done", work_done)]:
-            if value is not None and not isinstance(value, (int, float)):
-                raise TypeError(
-                    f"{name} must be a float or an integer, but got {type(value).__name__}."
-                )
+    def _as_float_array(name: str, value: Any) -> np.ndarray:
+        """Helper to convert a batch calculation input to a float64 array."""
+        try:
+            array = np.asarray(value)
+        except (TypeError, ValueError):
+            array = None
+        # Convert without a target dtype first so that None, strings and
+        # complex numbers are rejected like in the scalar API, rather than
+        # silently turned into NaN, parsed, or truncated.
+        if array is None or array.dtype.kind not in "biuf":
+            raise TypeError(
+                f"{name} must be an array-like of floats, but got {type(value).__name__}."
+            )
+        # No copy is made when value already is a float64 array.
+        return array.astype(np.float64, copy=False)
 
     @staticmethod
-    def calculate_delta_u(system: ThermodynamicSystem) -> float:
+    def calculate_delta_u(
+        system: Union[ThermodynamicSystem, ThermodynamicSystemArray]
+    ) -> Union[float, np.ndarray]:
         """
         Calculates the change in internal energy (ΔU) for a given system.
 
@@ -155,19 +457,20 @@ class FirstLawCalculator:
         where Q = heat added to the system, W = work done by the system.
 
         Args:
-            system (ThermodynamicSystem): The system object containing Q and W.
+            system (ThermodynamicSystem | ThermodynamicSystemArray): The system
+                object containing Q and W, or an array of systems.
 
         Returns:
-            float: The change in internal energy (ΔU) in Joules.
+            float | np.ndarray: The change in internal energy (ΔU) in Joules,
+                as an array with one entry per system for a ThermodynamicSystemArray.
         """
-        if not isinstance(system, ThermodynamicSystem):
+        if not isinstance(system,
+                          (ThermodynamicSystem, ThermodynamicSystemArray)):
             raise TypeError(
-                "Input must be an instance of ThermodynamicSystem.")
-
-        # Ensure that the values are floats before calculation
-        FirstLawCalculator._validate_calculation_inputs(
-            heat_added=system.heat_added, work_done=system.work_done)
-        return system.heat_added - system.work_done
+                "Input must be an instance of ThermodynamicSystem or ThermodynamicSystemArray."
+            )
+        # The system's fields are validated on assignment, no need to recheck.
+        return system.delta_u()
 
     @staticmethod
     def calculate_heat_added(delta_u: float, work_done: float) -> float:
@@ -184,9 +487,7 @@ class FirstLawCalculator:
         Returns:
             float: The heat added (Q) in Joules.
         """
-        FirstLawCalculator._validate_calculation_inputs(delta_u=delta_u,
-                                                        work_done=work_done)
-        return delta_u + work_done
+        return _as_float("delta_u", delta_u) + _as_float("work_done", work_done)
 
     @staticmethod
     def calculate_work_done(delta_u: float, heat_added: float) -> float:
@@ -203,9 +504,161 @@ class FirstLawCalculator:
         Returns:
             float: The work done by the system (W) in Joules.
         """
-        FirstLawCalculator._validate_calculation_inputs(delta_u=delta_u,
-                                                        heat_added=heat_added)
-        return heat_added - delta_u
+        delta_u = _as_float("delta_u", delta_u)
+        return _as_float("heat_added", heat_added) - delta_u
+
+    @staticmethod
+    def calculate_delta_u_batch(heat_added: ArrayLike,
+                                work_done: ArrayLike,
+                                out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculates the change in internal energy (ΔU) for many systems at once.
+
+        Formula: ΔU = Q - W, applied element-wise with NumPy broadcasting.
+
+        Args:
+            heat_added (ArrayLike): Heat added (Q) in Joules.
+            work_done (ArrayLike): Work done by the system (W) in Joules.
+            out (np.ndarray, optional): float64 array with the broadcast shape
+                                        of the inputs to write the result into;
+                                        it may be one of the inputs. A new
+                                        array is allocated if omitted.
+
+        Returns:
+            np.ndarray: The change in internal energy (ΔU) in Joules.
+
+        Raises:
+            TypeError: If an input is not an array-like of real numbers.
+            ValueError: If the input shapes cannot be broadcast together or do
+                        not match out.
+        """
+        heat_added = FirstLawCalculator._as_float_array("heat_added", heat_added)
+        work_done = FirstLawCalculator._as_float_array("work_done", work_done)
+        result = _parallel_batch("_delta_u_ufunc", heat_added, work_done, out)
+        if result is None:
+            result = np.subtract(heat_added, work_done, out=out)
+        return result
+
+    @staticmethod
+    def calculate_heat_added_batch(delta_u: ArrayLike,
+                                   work_done: ArrayLike,
+                                   out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculates the heat added (Q) for many systems at once.
+
+        Formula: Q = ΔU + W, applied element-wise with NumPy broadcasting.
+
+        Args:
+            delta_u (ArrayLike): Change in internal energy (ΔU) in Joules.
+            work_done (ArrayLike): Work done by the system (W) in Joules.
+            out (np.ndarray, optional): float64 array with the broadcast shape
+                                        of the inputs to write the result into;
+                                        it may be one of the inputs. A new
+                                        array is allocated if omitted.
+
+        Returns:
+            np.ndarray: The heat added (Q) in Joules.
+
+        Raises:
+            TypeError: If an input is not an array-like of real numbers.
+            ValueError: If the input shapes cannot be broadcast together or do
+                        not match out.
+        """
+        delta_u = FirstLawCalculator._as_float_array("delta_u", delta_u)
+        work_done = FirstLawCalculator._as_float_array("work_done", work_done)
+        result = _parallel_batch("_heat_added_ufunc", delta_u, work_done, out)
+        if result is None:
+            result = np.add(delta_u, work_done, out=out)
+        return result
+
+    @staticmethod
+    def calculate_work_done_batch(delta_u: ArrayLike,
+                                  heat_added: ArrayLike,
+                                  out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculates the work done (W) for many systems at once.
+
+        Formula: W = Q - ΔU, applied element-wise with NumPy broadcasting.
+
+        Args:
+            delta_u (ArrayLike): Change in internal energy (ΔU) in Joules.
+            heat_added (ArrayLike): Heat added to the system (Q) in Joules.
+            out (np.ndarray, optional): float64 array with the broadcast shape
+                                        of the inputs to write the result into;
+                                        it may be one of the inputs. A new
+                                        array is allocated if omitted.
+
+        Returns:
+            np.ndarray: The work done by the system (W) in Joules.
+
+        Raises:
+            TypeError: If an input is not an array-like of real numbers.
+            ValueError: If the input shapes cannot be broadcast together or do
+                        not match out.
+        """
+        delta_u = FirstLawCalculator._as_float_array("delta_u", delta_u)
+        heat_added = FirstLawCalculator._as_float_array("heat_added", heat_added)
+        result = _parallel_batch("_work_done_ufunc", delta_u, heat_added, out)
+        if result is None:
+            result = np.subtract(heat_added, delta_u, out=out)
+        return result
+
+
+def _dump_json(data: Dict[str, Any], finite: bool) -> bytes:
+    """
+    Encodes data as compact JSON bytes, using orjson when it is installed.
+
+    Values are floats or float64 NumPy arrays. finite tells whether all of them
+    are finite: orjson writes NaN/Infinity as null, so those are left to the
+    stdlib encoder.
+    """
+    if orjson is not None and finite:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps({
+        key: value.tolist() if isinstance(value, np.ndarray) else value
+        for key, value in data.items()
+    }).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """Decodes JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN/Infinity, and otherwise raises the
+            # canonical json.JSONDecodeError.
+            pass
+    return json.loads(raw)
+
+
+if msgspec is not None:
+
+    class _SystemRecord(msgspec.Struct):
+        """Typed schema of a JSON-serialized ThermodynamicSystem."""
+        internal_energy: float
+        heat_added: float
+        work_done: float
+
+    _decode_system_record = msgspec.json.Decoder(_SystemRecord).decode
+else:
+    _decode_system_record = None
+
+
+def _decode_system_json(raw: bytes) -> ThermodynamicSystem:
+    """Decodes a JSON-serialized ThermodynamicSystem."""
+    if _decode_system_record is not None:
+        # msgspec parses and type-checks the record in a single C pass.
+        try:
+            record = _decode_system_record(raw)
+        except msgspec.MsgspecError:
+            # Let the generic path below accept what it can (e.g. NaN) and
+            # raise the SDK's usual errors for the rest.
+            pass
+        else:
+            return ThermodynamicSystem(record.internal_energy,
+                                       record.heat_added, record.work_done)
+    return ThermodynamicSystem.from_dict(_load_json(raw))
 
 
 def save_system_to_json(system: ThermodynamicSystem, filename: str) -> None:
@@ -227,8 +680,9 @@ def save_system_to_json(system: ThermodynamicSystem, filename: str) -> None:
         raise TypeError("Input 'filename' must be a string.")
 
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(system.to_dict(), f, indent=4)
+        with open(filename, 'wb') as f:
+            data = system.to_dict()
+            f.write(_dump_json(data, all(map(math.isfinite, data.values()))))
     except IOError as e:
         raise IOError(f"Failed to save system to {filename}: {e}") from e
 
@@ -254,9 +708,8 @@ def load_system_from_json(filename: str) -> ThermodynamicSystem:
         raise TypeError("Input 'filename' must be a string.")
 
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return ThermodynamicSystem.from_dict(data)
+        with open(filename, 'rb') as f:
+            return _decode_system_json(f.read())
     except FileNotFoundError as e:
         raise FileNotFoundError(f"File not found: {filename}") from e
     except json.JSONDecodeError as e:
@@ -267,3 +720,266 @@ def load_system_from_json(filename: str) -> ThermodynamicSystem:
         raise type(e)(f"Error parsing system data from {filename}: {e}") from e
     except IOError as e:
         raise IOError(f"Failed to load system from {filename}: {e}") from e
+
+
+def save_systems_to_json(systems: ThermodynamicSystemArray,
+                         filename: str) -> None:
+    """
+    Serializes a ThermodynamicSystemArray to a JSON file in column form.
+
+    The file holds one object with the keys "internal_energy", "heat_added"
+    and "work_done", each mapping to a list with one value per system.
+
+    Args:
+        systems (ThermodynamicSystemArray): The systems to save.
+        filename (str): The path to the JSON file.
+
+    Raises:
+        TypeError: If 'systems' is not a ThermodynamicSystemArray instance.
+        IOError: If there's an issue writing the file.
+    """
+    if not isinstance(systems, ThermodynamicSystemArray):
+        raise TypeError(
+            "Input 'systems' must be an instance of ThermodynamicSystemArray.")
+    if not isinstance(filename, str):
+        raise TypeError("Input 'filename' must be a string.")
+
+    columns = {
+        # orjson serializes the raw buffer and ignores byte order, so columns
+        # must be native-endian float64 (a no-op for the usual columns).
+        key: np.ascontiguousarray(getattr(systems, key), dtype=np.float64)
+        for key in _REQUIRED_KEYS
+    }
+    finite = all(np.isfinite(column).all() for column in columns.values())
+    try:
+        with open(filename, 'wb') as f:
+            f.write(_dump_json(columns, finite))
+    except IOError as e:
+        raise IOError(f"Failed to save systems to {filename}: {e}") from e
+
+
+def load_systems_from_json(filename: str) -> ThermodynamicSystemArray:
+    """
+    Deserializes a ThermodynamicSystemArray from a JSON file.
+
+    Args:
+        filename (str): The path to a file written by save_systems_to_json.
+
+    Returns:
+        ThermodynamicSystemArray: The loaded systems.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        json.JSONDecodeError: If the file content is not valid JSON.
+        ValueError: If the JSON data is missing expected keys or the columns
+                    differ in length.
+        TypeError: If a column is not a list of numbers.
+        IOError: If there's an issue reading the file.
+    """
+    if not isinstance(filename, str):
+        raise TypeError("Input 'filename' must be a string.")
+
+    try:
+        with open(filename, 'rb') as f:
+            data = _load_json(f.read())
+        return ThermodynamicSystemArray._from_dict(data)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {filename}") from e
+    except json.JSONDecodeError as e:
+        raise json.JSONDecodeError(
+            f"Invalid JSON format in {filename}: {e.msg}", e.doc, e.pos) from e
+    except (ValueError, TypeError) as e:
+        raise type(e)(f"Error parsing system data from {filename}: {e}") from e
+    except IOError as e:
+        raise IOError(f"Failed to load systems from {filename}: {e}") from e
+
+
+def save_system_to_binary(system: ThermodynamicSystem, filename: str) -> None:
+    """
+    Serializes a ThermodynamicSystem instance to a compact binary file.
+
+    The file holds a 4-byte magic header (b"THSD") followed by internal_energy,
+    heat_added and work_done as little-endian float64 values (28 bytes total).
+
+    Args:
+        system (ThermodynamicSystem): The system instance to save.
+        filename (str): The path to the binary file.
+
+    Raises:
+        TypeError: If 'system' is not a ThermodynamicSystem instance.
+        IOError: If there's an issue writing the file.
+    """
+    if not isinstance(system, ThermodynamicSystem):
+        raise TypeError(
+            "Input 'system' must be an instance of ThermodynamicSystem.")
+    if not isinstance(filename, str):
+        raise TypeError("Input 'filename' must be a string.")
+
+    try:
+        with open(filename, 'wb') as f:
+            f.write(
+                _BINARY_RECORD.pack(_BINARY_MAGIC, system._internal_energy,
+                                    system._heat_added, system._work_done))
+    except IOError as e:
+        raise IOError(f"Failed to save system to {filename}: {e}") from e
+
+
+def load_system_from_binary(filename: str) -> ThermodynamicSystem:
+    """
+    Deserializes a ThermodynamicSystem instance from a binary file.
+
+    Args:
+        filename (str): The path to a file written by save_system_to_binary.
+
+    Returns:
+        ThermodynamicSystem: The loaded system instance.
+
+    Raises:
+        TypeError: If 'filename' is not a string.
+        FileNotFoundError: If the specified file does not exist.
+        ValueError: If the file is not a valid system record.
+        IOError: If there's an issue reading the file.
+    """
+    if not isinstance(filename, str):
+        raise TypeError("Input 'filename' must be a string.")
+
+    try:
+        with open(filename, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {filename}") from e
+    except IOError as e:
+        raise IOError(f"Failed to load system from {filename}: {e}") from e
+
+    if len(raw) != _BINARY_RECORD.size or not raw.startswith(_BINARY_MAGIC):
+        raise ValueError(f"{filename} is not a valid binary system record.")
+    _, internal_energy, heat_added, work_done = _BINARY_RECORD.unpack(raw)
+    return ThermodynamicSystem(internal_energy, heat_added, work_done)
+
+
+def save_systems_to_binary(systems: ThermodynamicSystemArray,
+                           filename: str) -> None:
+    """
+    Serializes a ThermodynamicSystemArray to a binary file.
+
+    The file holds a 32-byte header (b"TSDK" magic, format version and system
+    count) followed by the internal_energy, heat_added and work_done columns
+    as contiguous little-endian float64 arrays.
+
+    Args:
+        systems (ThermodynamicSystemArray): The systems to save.
+        filename (str): The path to the binary file.
+
+    Raises:
+        TypeError: If 'systems' is not a ThermodynamicSystemArray instance.
+        IOError: If there's an issue writing the file.
+    """
+    if not isinstance(systems, ThermodynamicSystemArray):
+        raise TypeError(
+            "Input 'systems' must be an instance of ThermodynamicSystemArray.")
+    if not isinstance(filename, str):
+        raise TypeError("Input 'filename' must be a string.")
+
+    # Write next to the target and swap it in: the columns of a loaded array
+    # may still be memory-mapped from 'filename', and truncating that file in
+    # place would destroy both the data and the mapping.
+    tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        try:
+            with open(tmp_filename, 'xb') as f:
+                f.write(_ARRAY_HEADER.pack(_ARRAY_MAGIC, _ARRAY_VERSION,
+                                           len(systems)))
+                for key in _REQUIRED_KEYS:
+                    getattr(systems, key).astype("<f8", copy=False).tofile(f)
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            # Never leave the temporary file behind, whatever went wrong.
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            raise
+    except IOError as e:
+        raise IOError(f"Failed to save systems to {filename}: {e}") from e
+
+
+def load_systems_from_binary(filename: str) -> ThermodynamicSystemArray:
+    """
+    Deserializes a ThermodynamicSystemArray from a binary file.
+
+    The columns are memory-mapped copy-on-write rather than read: data is
+    paged in from the OS cache as it is accessed, and modifying the loaded
+    columns never changes the file.
+
+    Args:
+        filename (str): The path to a file written by save_systems_to_binary.
+
+    Returns:
+        ThermodynamicSystemArray: The loaded systems.
+
+    Raises:
+        TypeError: If 'filename' is not a string.
+        FileNotFoundError: If the specified file does not exist.
+        ValueError: If the file is not a valid system array file.
+        IOError: If there's an issue reading the file.
+    """
+    if not isinstance(filename, str):
+        raise TypeError("Input 'filename' must be a string.")
+
+    try:
+        with open(filename, 'rb') as f:
+            header = f.read(_ARRAY_HEADER.size)
+            size = os.fstat(f.fileno()).st_size
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {filename}") from e
+    except IOError as e:
+        raise IOError(f"Failed to load systems from {filename}: {e}") from e
+
+    if len(header) != _ARRAY_HEADER.size:
+        raise ValueError(f"{filename} is not a valid binary system array file.")
+    magic, version, n = _ARRAY_HEADER.unpack(header)
+    if (magic != _ARRAY_MAGIC or version != _ARRAY_VERSION
+            or size != _ARRAY_HEADER.size + 3 * 8 * n):
+        raise ValueError(f"{filename} is not a valid binary system array file.")
+    if n == 0:
+        return ThermodynamicSystemArray(0)
+
+    columns = np.memmap(filename,
+                        dtype="<f8",
+                        mode="c",
+                        offset=_ARRAY_HEADER.size,
+                        shape=(3, n))
+    return ThermodynamicSystemArray._from_columns(*columns)
+
+
+def save_system(system: ThermodynamicSystem, filename: str) -> None:
+    """
+    Saves a ThermodynamicSystem, choosing the format from the file suffix.
+
+    Files ending in ".bin" use the binary format; anything else is saved as JSON.
+
+    Args:
+        system (ThermodynamicSystem): The system instance to save.
+        filename (str): The path to the output file.
+    """
+    if isinstance(filename, str) and filename.endswith(_BINARY_SUFFIX):
+        save_system_to_binary(system, filename)
+    else:
+        save_system_to_json(system, filename)
+
+
+def load_system(filename: str) -> ThermodynamicSystem:
+    """
+    Loads a ThermodynamicSystem, choosing the format from the file suffix.
+
+    Files ending in ".bin" are read as binary; anything else is read as JSON.
+
+    Args:
+        filename (str): The path to the input file.
+
+    Returns:
+        ThermodynamicSystem: The loaded system instance.
+    """
+    if isinstance(filename, str) and filename.endswith(_BINARY_SUFFIX):
+        return load_system_from_binary(filename)
+    return load_system_from_json(filename)